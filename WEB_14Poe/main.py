@@ -1,18 +1,20 @@
+import cloudinary
 import redis.asyncio as redis
 from fastapi_limiter import FastAPILimiter
 from fastapi import FastAPI, Depends, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.database.db import get_db
+from src.database.db import get_db, sessionmanager
 from src.routes import contacts
 from src.routes import auth
 from src.routes import users
 from src.conf.config import config
 
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 
 origins = ['*']
 
@@ -37,6 +39,16 @@ def index():
 async def startup():
     r = redis.Redis(host=config.REDIS_DOMAIN, port=config.REDIS_PORT, db=0, password=config.REDIS_PASSWORD)
     await FastAPILimiter.init(r)
+    cloudinary.config(
+        cloud_name=config.CLOUDINARY_NAME,
+        api_key=config.CLOUDINARY_API_KEY,
+        api_secret=config.CLOUDINARY_API_SECRET,
+        secure=True
+    )
+    try:
+        await sessionmanager.warm_up(config.DB_POOL_WARMUP)
+    except Exception as err:
+        print(err)
 
 
 @app.get('/api/healthcheker')
@@ -0,0 +1,40 @@
+"""add trgm indexes for contacts
+
+Revision ID: 7b2e4c91d3a5
+Revises: 04678e5fbbbd
+Create Date: 2026-10-15 11:20:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7b2e4c91d3a5'
+down_revision: Union[str, None] = '04678e5fbbbd'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.drop_index('ix_contacts_firstname', table_name='contacts')
+    op.drop_index('ix_contacts_surname', table_name='contacts')
+    op.drop_index('ix_contacts_email', table_name='contacts')
+    op.create_index('contacts_firstname_trgm', 'contacts', ['firstname'], unique=False,
+                    postgresql_using='gin', postgresql_ops={'firstname': 'gin_trgm_ops'})
+    op.create_index('contacts_surname_trgm', 'contacts', ['surname'], unique=False,
+                    postgresql_using='gin', postgresql_ops={'surname': 'gin_trgm_ops'})
+    op.create_index('contacts_email_trgm', 'contacts', ['email'], unique=False,
+                    postgresql_using='gin', postgresql_ops={'email': 'gin_trgm_ops'})
+
+
+def downgrade() -> None:
+    op.drop_index('contacts_email_trgm', table_name='contacts')
+    op.drop_index('contacts_surname_trgm', table_name='contacts')
+    op.drop_index('contacts_firstname_trgm', table_name='contacts')
+    op.create_index('ix_contacts_email', 'contacts', ['email'], unique=False)
+    op.create_index('ix_contacts_surname', 'contacts', ['surname'], unique=False)
+    op.create_index('ix_contacts_firstname', 'contacts', ['firstname'], unique=False)
@@ -0,0 +1,28 @@
+"""add birthday month day index
+
+Revision ID: a41f0c6e8b27
+Revises: 7b2e4c91d3a5
+Create Date: 2026-10-15 11:40:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a41f0c6e8b27'
+down_revision: Union[str, None] = '7b2e4c91d3a5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # to_char() is only STABLE, so the month-day key is built from EXTRACT() which can be indexed
+    op.execute('CREATE INDEX contacts_bday_md ON contacts '
+               '(user_id, (EXTRACT(month FROM birthday) * 100 + EXTRACT(day FROM birthday)))')
+
+
+def downgrade() -> None:
+    op.drop_index('contacts_bday_md', table_name='contacts')
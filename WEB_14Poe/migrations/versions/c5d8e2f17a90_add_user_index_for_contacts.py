@@ -0,0 +1,26 @@
+"""add user index for contacts
+
+Revision ID: c5d8e2f17a90
+Revises: a41f0c6e8b27
+Create Date: 2026-10-15 12:05:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5d8e2f17a90'
+down_revision: Union[str, None] = 'a41f0c6e8b27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('contacts_user_id_id_idx', 'contacts', ['user_id', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('contacts_user_id_id_idx', table_name='contacts')
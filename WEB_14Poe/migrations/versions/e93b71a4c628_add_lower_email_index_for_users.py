@@ -0,0 +1,31 @@
+"""add lower email index for users
+
+Revision ID: e93b71a4c628
+Revises: c5d8e2f17a90
+Create Date: 2026-10-15 12:40:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e93b71a4c628'
+down_revision: Union[str, None] = 'c5d8e2f17a90'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # fails on addresses that only differ by case, those have to be merged by hand first
+    op.execute('UPDATE users SET email = lower(email) WHERE email <> lower(email)')
+    with op.get_context().autocommit_block():
+        op.execute('CREATE UNIQUE INDEX CONCURRENTLY users_email_lower_uniq ON users (lower(email))')
+    op.drop_constraint('users_email_key', 'users', type_='unique')
+
+
+def downgrade() -> None:
+    op.create_unique_constraint('users_email_key', 'users', ['email'])
+    op.drop_index('users_email_lower_uniq', table_name='users')
@@ -1,14 +1,39 @@
+import asyncio
 import contextlib
 
-from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from src.conf.config import config
 
 
 class DatabaseSeesionManager:
 
     def __init__(self, url: str):
-        self._engine: AsyncEngine | None = create_async_engine(url)
-        self._session_maker: async_sessionmaker = async_sessionmaker(autoflush=False, autocommit=False, bind=self._engine)
+        connect_args = {}
+        if make_url(url).get_driver_name() == 'asyncpg':
+            # keep prepared statements for the hot queries on every pooled connection
+            connect_args = {'prepared_statement_cache_size': config.DB_STATEMENT_CACHE_SIZE,
+                            'statement_cache_size': config.DB_STATEMENT_CACHE_SIZE}
+        self._engine: AsyncEngine | None = create_async_engine(url, poolclass=AsyncAdaptedQueuePool,
+                                                               pool_size=config.DB_POOL_SIZE,
+                                                               max_overflow=config.DB_MAX_OVERFLOW,
+                                                               pool_pre_ping=True,
+                                                               pool_recycle=config.DB_POOL_RECYCLE,
+                                                               connect_args=connect_args)
+        self._session_maker: async_sessionmaker = async_sessionmaker(autoflush=False, autocommit=False, expire_on_commit=False,
+                                                                  bind=self._engine)
+
+
+    async def warm_up(self, size: int):
+        if self._engine is None:
+            raise Exception('Engine is not initialized')
+        # SQLAlchemy has no pool min_size, so open connections concurrently and return them to the pool
+        results = await asyncio.gather(*[self._engine.connect() for _ in range(size)], return_exceptions=True)
+        await asyncio.gather(*[result.close() for result in results if isinstance(result, AsyncConnection)])
+        errors = [result for result in results if isinstance(result, BaseException)]
+        if errors:
+            raise errors[0]
 
 
     @contextlib.asynccontextmanager
@@ -1,5 +1,5 @@
 from datetime import date
-from sqlalchemy import String, Date, Integer, ForeignKey, DateTime, Boolean, func
+from sqlalchemy import String, Date, Integer, ForeignKey, DateTime, Boolean, Index, extract, func, literal_column
 from sqlalchemy.orm import Mapped, mapped_column, DeclarativeBase, relationship
 
 class Base(DeclarativeBase):
@@ -8,28 +8,44 @@ class Base(DeclarativeBase):
 
 class Contact(Base):
     __tablename__ = 'contacts'
+    __table_args__ = (
+        Index('contacts_firstname_trgm', 'firstname', postgresql_using='gin', postgresql_ops={'firstname': 'gin_trgm_ops'}),
+        Index('contacts_surname_trgm', 'surname', postgresql_using='gin', postgresql_ops={'surname': 'gin_trgm_ops'}),
+        Index('contacts_email_trgm', 'email', postgresql_using='gin', postgresql_ops={'email': 'gin_trgm_ops'}),
+        Index('contacts_user_id_id_idx', 'user_id', 'id'),
+    )
+    __mapper_args__ = {'eager_defaults': True}
     id: Mapped[int] = mapped_column(primary_key=True)
-    firstname: Mapped[str] = mapped_column(String(25), index=True)
-    surname: Mapped[str] = mapped_column(String(25), index=True)
-    email: Mapped[str] = mapped_column(String(50), index=True)
+    firstname: Mapped[str] = mapped_column(String(25))
+    surname: Mapped[str] = mapped_column(String(25))
+    email: Mapped[str] = mapped_column(String(50))
     phone: Mapped[str] = mapped_column(String(20), index=True)
     birthday: Mapped[Date] = mapped_column(Date)
     details: Mapped[str | None] = mapped_column(String(150), nullable=True)
     created_at: Mapped[date] = mapped_column('created_at', DateTime, default=func.now(), nullable=True)
     updated_at: Mapped[date] = mapped_column('updated_at', DateTime, default=func.now(), onupdate=func.now(), nullable=True)
     user_id: Mapped[int] = mapped_column(Integer, ForeignKey('users.id'), nullable=True)
-    user: Mapped['User'] = relationship('User', backref='contacts', lazy='joined')
+    user: Mapped['User'] = relationship('User', back_populates='contacts', lazy='raise')
+
+
+Index('contacts_bday_md', Contact.user_id,
+      extract('month', Contact.birthday) * literal_column('100') + extract('day', Contact.birthday))
 
 
 
 class User(Base):
     __tablename__= 'users'
+    __mapper_args__ = {'eager_defaults': True}
     id: Mapped[int] = mapped_column(primary_key=True)
     username: Mapped[str] = mapped_column(String(50))
-    email: Mapped[str] = mapped_column(String(150), nullable=False, unique=True)
+    email: Mapped[str] = mapped_column(String(150), nullable=False)
     password: Mapped[str] = mapped_column(String(255), nullable=False)
     avatar: Mapped[str] = mapped_column(String(255), nullable=True)
     refresh_token: Mapped[str] = mapped_column(String(255), nullable=True)
     created_at: Mapped[date] = mapped_column('created_at', DateTime, default=func.now())
     updated_at: Mapped[date] = mapped_column('updated_at', DateTime, default=func.now(), onupdate=func.now())
-    confirmed: Mapped[bool] = mapped_column(Boolean, default=False, nullable=True)
\ No newline at end of file
+    confirmed: Mapped[bool] = mapped_column(Boolean, default=False, nullable=True)
+    contacts: Mapped[list['Contact']] = relationship(back_populates='user', lazy='raise')
+
+
+Index('users_email_lower_uniq', func.lower(User.email), unique=True)
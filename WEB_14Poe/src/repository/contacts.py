@@ -1,16 +1,38 @@
 from datetime import datetime, timedelta
 
-from sqlalchemy import select, and_, cast, DATE, func, Date
+from sqlalchemy import select, insert, update, delete, or_, extract, literal_column, bindparam
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import set_committed_value
 
 from src.database.models import Contact, User
 from src.schemas.contact import ContactSchema, ContactUpdateSchema
 
 
-async def get_contacts(limit: int, offset: int, db: AsyncSession, user: User):
+_GET_CONTACT_STMT = select(Contact).where(Contact.id == bindparam('contact_id'),
+                                          Contact.user_id == bindparam('user_id'))
 
+
+def _month_day(column):
+
+    """
+    Builds a ``month * 100 + day`` expression that ignores the year of a date column.
+
+    The expression matches the ``contacts_bday_md`` index, so it must stay in sync with that migration.
+
+    :param column: The date column.
+    :return: The SQL expression for the month-day key.
     """
-    Retrieves a list of contacts for a specific user with specified pagination parameters.
+
+    return extract('month', column) * literal_column('100') + extract('day', column)
+
+
+async def get_contacts(limit: int, offset: int, db: AsyncSession, user: User, after_id: int | None = None):
+
+    """
+    Retrieves a list of contacts for a specific user ordered by ID with specified pagination parameters.
+
+    When ``after_id`` is given the page starts right after that contact (keyset pagination)
+    and ``offset`` is ignored.
 
     :param offset: The number of contactss to skip.
     :type offset: int
@@ -20,11 +42,17 @@ async def get_contacts(limit: int, offset: int, db: AsyncSession, user: User):
     :type user: User
     :param db: The database session.
     :type db: AsyncSession
+    :param after_id: The ID of the last contact of the previous page.
+    :type after_id: int or None
     :return: A list of contacts.
     :rtype: List[Contact]
     """
 
-    statmnt = select(Contact).filter_by(user=user).offset(offset).limit(limit)
+    statmnt = select(Contact).where(Contact.user_id == user.id).order_by(Contact.id).limit(limit)
+    if after_id is not None:
+        statmnt = statmnt.where(Contact.id > after_id)
+    else:
+        statmnt = statmnt.offset(offset)
     contacts = await db.execute(statmnt)
     return contacts.scalars().all()
 
@@ -32,7 +60,7 @@ async def get_contacts(limit: int, offset: int, db: AsyncSession, user: User):
 async def search_contacts(query, db: AsyncSession, user: User):
 
     """
-    Searches for contacts based on a query string in the first name, surname, or email.
+    Searches for contacts whose first name, surname, or email contains the query string.
 
     :param query: The search query string.
     :type query: str
@@ -44,9 +72,11 @@ async def search_contacts(query, db: AsyncSession, user: User):
     :rtype: List[Contact]
     """
 
-    statmnt = select(Contact).filter_by(user=user).filter((Contact.firstname.ilike(query))
-                                     | (Contact.surname.ilike(query))
-                                     | (Contact.email.ilike(query)))
+    escaped = query.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+    pattern = f'%{escaped}%'
+    statmnt = select(Contact).where(Contact.user_id == user.id).filter((Contact.firstname.ilike(pattern, escape='\\'))
+                                     | (Contact.surname.ilike(pattern, escape='\\'))
+                                     | (Contact.email.ilike(pattern, escape='\\')))
     results = await db.execute(statmnt)
     return results.scalars().all()
 
@@ -66,9 +96,12 @@ async def get_contact(contact_id: int, db: AsyncSession, user: User):
     :rtype: Contact or None
     """
 
-    statmnt = select(Contact).filter_by(id=contact_id, user=user)
-    contact = await db.execute(statmnt)
-    return contact.scalar_one_or_none()
+    contact = await db.execute(_GET_CONTACT_STMT, {'contact_id': contact_id, 'user_id': user.id})
+    contact = contact.scalar_one_or_none()
+    if contact:
+        # the owner is the filtered user, so attaching it beats a selectinload(Contact.user) round-trip
+        set_committed_value(contact, 'user', user)
+    return contact
 
 
 async def create_contact(body: ContactSchema, db: AsyncSession, user: User):
@@ -86,13 +119,35 @@ async def create_contact(body: ContactSchema, db: AsyncSession, user: User):
     :rtype: Contact
     """
 
-    contact = Contact(**body.model_dump(exclude_unset=True), user=user)
+    contact = Contact(**body.model_dump(exclude_unset=True), user_id=user.id)
     db.add(contact)
     await db.commit()
-    await db.refresh(contact)
+    set_committed_value(contact, 'user', user)
     return contact
 
 
+async def create_contacts(bodies: list[ContactSchema], db: AsyncSession, user: User):
+
+    """
+    Creates several contacts for a specific user with a single INSERT statement and one commit.
+
+    :param bodies: The schemas containing the contact details.
+    :type bodies: list[ContactSchema]
+    :param db: The database session.
+    :type db: AsyncSession
+    :param user: The user for whom the contacts are created.
+    :type user: User
+    :return: The newly created contacts.
+    :rtype: List[Contact]
+    """
+
+    statmnt = insert(Contact).returning(Contact)
+    contacts = await db.scalars(statmnt, [body.model_dump() | {'user_id': user.id} for body in bodies])
+    contacts = contacts.all()
+    await db.commit()
+    return contacts
+
+
 async def update_contact(contact_id: int, body: ContactUpdateSchema, db: AsyncSession, user: User):
 
     """
@@ -110,18 +165,13 @@ async def update_contact(contact_id: int, body: ContactUpdateSchema, db: AsyncSe
     :rtype: Contact or None
     """
 
-    statmnt = select(Contact).filter_by(id=contact_id, user=user)
-    result = await db.execute(statmnt)
+    statmnt = update(Contact).where(Contact.id == contact_id, Contact.user_id == user.id)\
+                             .values(**body.model_dump(exclude_unset=True)).returning(Contact)
+    result = await db.execute(statmnt.execution_options(populate_existing=True))
     contact = result.scalar_one_or_none()
+    await db.commit()
     if contact:
-        contact.firstname = body.firstname
-        contact.surname = body.surname
-        contact.email = body.email
-        contact.phone = body.phone
-        contact.birthday = body.birthday
-        contact.details = body.details
-        await db.commit()
-        await db.refresh(contact)
+        set_committed_value(contact, 'user', user)
     return contact
 
 
@@ -136,17 +186,14 @@ async def delete_contact(contact_id: int, db: AsyncSession, user: User):
     :type db: AsyncSession
     :param user: The user who owns the contact.
     :type user: User
-    :return: The deleted contact, or None if not found.
-    :rtype: Contact or None
+    :return: The number of deleted contacts (0 if not found).
+    :rtype: int
     """
 
-    statmnt = select(Contact).filter_by(id=contact_id, user=user)
-    contact = await db.execute(statmnt)
-    contact = contact.scalar_one_or_none()
-    if contact:
-        await db.delete(contact)
-        await db.commit()
-    return contact
+    statmnt = delete(Contact).where(Contact.id == contact_id, Contact.user_id == user.id)
+    result = await db.execute(statmnt.execution_options(synchronize_session=False))
+    await db.commit()
+    return result.rowcount
 
 
 
@@ -165,11 +212,13 @@ async def get_upcoming_birthdays(db: AsyncSession, user: User):
 
     today = datetime.now().date()
     week_from_today = today + timedelta(days=7)
-    statmnt = select(Contact).filter_by(user=user).filter(
-        and_(
-            cast(Contact.birthday, Date) >= today,
-            cast(Contact.birthday, Date) <= week_from_today
-        )
-    )
+    today_md = today.month * 100 + today.day
+    week_md = week_from_today.month * 100 + week_from_today.day
+    birthday_md = _month_day(Contact.birthday)
+    if today_md <= week_md:
+        in_window = birthday_md.between(today_md, week_md)
+    else:
+        in_window = or_(birthday_md >= today_md, birthday_md <= week_md)
+    statmnt = select(Contact).where(Contact.user_id == user.id, in_window)
     contacts = await db.execute(statmnt)
-    return contacts.scalars().all()
\ No newline at end of file
+    return contacts.scalars().all()
@@ -1,13 +1,41 @@
+import hashlib
+
+import orjson
 from fastapi import Depends
-from sqlalchemy import select
+from fastapi_limiter import FastAPILimiter
+from redis.exceptions import RedisError
+from sqlalchemy import select, update, func
 from sqlalchemy.ext.asyncio import AsyncSession
-from libgravatar import Gravatar
+from sqlalchemy.orm import make_transient_to_detached
+from sqlalchemy.orm.attributes import set_committed_value
 
+from src.conf.config import config
 from src.database.db import get_db
 from src.database.models import User
 from src.schemas.user import UserSchema, UserResponse
 
 
+CACHED_USER_FIELDS = ('id', 'username', 'email', 'avatar', 'confirmed')
+
+
+
+async def invalidate_cached_user(email: str):
+
+    """
+    Removes a cached user from Redis so the next lookup reads it from the database.
+
+    :param email: The email address of the cached user.
+    :type email: str
+    """
+
+    if FastAPILimiter.redis is None:
+        return
+    try:
+        await FastAPILimiter.redis.delete(f'user:{email.lower()}')
+    except RedisError as err:
+        print(err)
+
+
 
 async def get_user_by_email(email: str, db: AsyncSession = Depends(get_db)):
 
@@ -22,13 +50,53 @@ async def get_user_by_email(email: str, db: AsyncSession = Depends(get_db)):
     :rtype: User or None
     """
 
-    statmnt = select(User).filter_by(email=email)
+    statmnt = select(User).where(func.lower(User.email) == email.lower())
     user = await db.execute(statmnt)
     user = user.scalar_one_or_none()
     return user
 
 
 
+async def get_cached_user_by_email(email: str, db: AsyncSession = Depends(get_db)):
+
+    """
+    Retrieves a user by their email address, using the Redis cache when it is available.
+
+    Only the columns in ``CACHED_USER_FIELDS`` are cached, so the returned user has no password
+    or refresh token loaded. Use :func:`get_user_by_email` when those are needed.
+
+    :param email: The email address of the user to retrieve.
+    :type email: str
+    :param db: The database session.
+    :type db: AsyncSession
+    :return: The user with the specified email, or None if not found.
+    :rtype: User or None
+    """
+
+    key = f'user:{email.lower()}'
+    cache = FastAPILimiter.redis
+    if cache is not None:
+        try:
+            cached_user = await cache.get(key)
+        except RedisError as err:
+            print(err)
+            cache, cached_user = None, None
+        if cached_user is not None:
+            user = User(**orjson.loads(cached_user))
+            make_transient_to_detached(user)
+            return await db.merge(user, load=False)
+
+    user = await get_user_by_email(email, db)
+    if cache is not None and user is not None:
+        try:
+            await cache.set(key, orjson.dumps({field: getattr(user, field) for field in CACHED_USER_FIELDS}),
+                            ex=config.USER_CACHE_TTL)
+        except RedisError as err:
+            print(err)
+    return user
+
+
+
 async def create_user(body: UserSchema, db: AsyncSession = Depends(get_db)):
 
     """
@@ -42,17 +110,12 @@ async def create_user(body: UserSchema, db: AsyncSession = Depends(get_db)):
     :rtype: User
     """
 
-    avatar = None
-    try:
-        g = Gravatar(body.email)
-        avatar = g.get_image()
-    except Exception as err:
-        print(err)
+    email_hash = hashlib.md5(body.email.strip().lower().encode()).hexdigest()
+    avatar = f'https://www.gravatar.com/avatar/{email_hash}?d=identicon'
 
     new_user = User(**body.model_dump(), avatar=avatar)
     db.add(new_user)
     await db.commit()
-    await db. refresh(new_user)
     return new_user
 
 
@@ -70,8 +133,11 @@ async def update_token(user: User, token: str | None, db: AsyncSession):
     :type db: AsyncSession
     """
 
-    user.refresh_token = token
+    statmnt = update(User).where(User.id == user.id).values(refresh_token=token)
+    await db.execute(statmnt.execution_options(synchronize_session=False))
     await db.commit()
+    set_committed_value(user, 'refresh_token', token)
+    await invalidate_cached_user(user.email)
 
 
 
@@ -86,9 +152,10 @@ async def confirmed_email(email: str, db: AsyncSession):
     :type db: AsyncSession
     """
 
-    user = await get_user_by_email(email, db)
-    user.confirmed = True
+    statmnt = update(User).where(func.lower(User.email) == email.lower()).values(confirmed=True)
+    await db.execute(statmnt.execution_options(synchronize_session=False))
     await db.commit()
+    await invalidate_cached_user(email)
 
 
 
@@ -111,4 +178,5 @@ async def update_avatar(email, url: str, db: AsyncSession):
     user.avatar = url
     await db.commit()
     await db.refresh(user)
+    await invalidate_cached_user(email)
     return user
\ No newline at end of file
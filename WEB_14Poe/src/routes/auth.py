@@ -1,6 +1,9 @@
+import asyncio
+
 from fastapi import APIRouter, HTTPException, Depends, status, Security, BackgroundTasks, Request
 from fastapi.security import OAuth2PasswordRequestForm, HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi_limiter.depends import RateLimiter
 
 from src.database.db import get_db
 from src.repository import users as repositories_users
@@ -35,7 +38,7 @@ async def signup(body: UserSchema, bt: BackgroundTasks, request: Request, db: As
     exist_user = await repositories_users.get_user_by_email(body.email, db)
     if exist_user:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=messages.ACCOUNT_EXIST)
-    body.password = auth_service.get_password_hash(body.password)
+    body.password = await asyncio.to_thread(auth_service.get_password_hash, body.password)
     new_user = await repositories_users.create_user(body, db)
     bt.add_task(send_email, new_user.email, new_user.username, str(request.base_url))
     return new_user
@@ -62,7 +65,7 @@ async def login(body: OAuth2PasswordRequestForm = Depends(), db: AsyncSession =
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid email")
     if not user.confirmed:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Email is not confirmed")
-    if not auth_service.verify_password(body.password, user.password):
+    if not await asyncio.to_thread(auth_service.verify_password, body.password, user.password):
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid password")
     # Generate JWT
     access_token = await auth_service.create_access_token(data={"sub": user.email})
@@ -128,7 +131,7 @@ async def confirmed_email(token: str, db: AsyncSession = Depends(get_db)):
 
 
 
-@router.post('/request_email')
+@router.post('/request_email', dependencies=[Depends(RateLimiter(times=1, seconds=60))])
 async def request_email(body: RequestEmail, background_tasks: BackgroundTasks, request: Request,
                         db: AsyncSession = Depends(get_db)):
     
@@ -145,12 +148,13 @@ async def request_email(body: RequestEmail, background_tasks: BackgroundTasks, r
     :type db: AsyncSession
     :return: A message indicating that the confirmation email has been sent.
     :rtype: dict
+    :raises HTTPException: If the rate limit is exceeded.
     """
 
-    user = await repositories_users.get_user_by_email(body.email, db)
-
+    user = await repositories_users.get_cached_user_by_email(body.email, db)
+    if user is None:
+        return {"message": "Check your email for confirmation."}
     if user.confirmed:
         return {"message": "Your email is already confirmed"}
-    if user:
-        background_tasks.add_task(send_email, user.email, user.username, str(request.base_url))
+    background_tasks.add_task(send_email, user.email, user.username, str(request.base_url))
     return {"message": "Check your email for confirmation."}
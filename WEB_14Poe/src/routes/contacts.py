@@ -1,17 +1,34 @@
-from fastapi import APIRouter, HTTPException, Depends, status, Path, Query
+from fastapi import APIRouter, HTTPException, Depends, status, Path, Query, Body, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi_limiter.depends import RateLimiter
 
 from src.database.models import User
 from src.database.db import get_db
 from src.repository import contacts as repositories_contacts
-from src.schemas.contact import ContactSchema, ContactUpdateSchema, ContactResponse, ContactCreate
+from src.schemas.contact import ContactSchema, ContactUpdateSchema, ContactResponse, ContactListItem, ContactCreate,\
+                                CONTACT_LIST_ADAPTER
 from src.services.auth import auth_service
 
 
 router = APIRouter(prefix='/contacts', tags=['contacts'])
 
-@router.get('/upcoming_birthdays', response_model=list[ContactResponse])
+
+def contact_list_response(contacts) -> Response:
+
+    """
+    Validates and serializes a list of contacts in one pass with the shared TypeAdapter.
+
+    :param contacts: The contacts to serialize.
+    :type contacts: List[Contact]
+    :return: The JSON response with the serialized contacts.
+    :rtype: Response
+    """
+
+    items = CONTACT_LIST_ADAPTER.validate_python(contacts, from_attributes=True)
+    return Response(CONTACT_LIST_ADAPTER.dump_json(items, by_alias=True), media_type='application/json')
+
+
+@router.get('/upcoming_birthdays', response_model=None, responses={200: {'model': list[ContactListItem]}})
 async def get_upcoming_birthdays(db: AsyncSession = Depends(get_db), user: User = Depends(auth_service.get_current_user)):
 
     """
@@ -22,35 +39,46 @@ async def get_upcoming_birthdays(db: AsyncSession = Depends(get_db), user: User
     :param user: The current authenticated user.
     :type user: User
     :return: A list of contacts with birthdays in the next 7 days.
-    :rtype: list[ContactResponse]
+    :rtype: list[ContactListItem]
     """
 
     contacts = await repositories_contacts.get_upcoming_birthdays(db, user)
-    return contacts
+    return contact_list_response(contacts)
 
 
 
-@router.get('/', response_model=list[ContactResponse])
-async def get_contacts(limit: int = Query(default=1, ge=1, le=500), offset: int = Query(default=0, ge=0),
+@router.get('/', response_model=None, responses={200: {'model': list[ContactListItem]}})
+async def get_contacts(request: Request, limit: int = Query(default=1, ge=1, le=500),
+                       offset: int = Query(default=0, ge=0, deprecated=True), after_id: int | None = Query(default=None, ge=0),
                        db: AsyncSession = Depends(get_db), user: User = Depends(auth_service.get_current_user)):
     
     """
     Retrieves a paginated list of contacts for the current user.
 
+    A full page carries a ``Link: <...>; rel="next"`` header pointing to the next page via ``after_id``.
+
+    :param request: The HTTP request object.
+    :type request: Request
     :param limit: The maximum number of contacts to return (default is 1, max is 500).
     :type limit: int
-    :param offset: The number of contacts to skip before starting to collect the result set.
+    :param offset: Deprecated, use after_id. The number of contacts to skip before starting to collect the result set.
     :type offset: int
+    :param after_id: The ID of the last contact from the previous page.
+    :type after_id: int or None
     :param db: The database session.
     :type db: AsyncSession
     :param user: The current authenticated user.
     :type user: User
     :return: A paginated list of contacts.
-    :rtype: list[ContactResponse]
+    :rtype: list[ContactListItem]
     """
 
-    contacts = await repositories_contacts.get_contacts(limit, offset, db, user)
-    return contacts
+    contacts = await repositories_contacts.get_contacts(limit, offset, db, user, after_id)
+    response = contact_list_response(contacts)
+    if len(contacts) == limit:
+        next_url = request.url.remove_query_params('offset').include_query_params(after_id=contacts[-1].id)
+        response.headers['Link'] = f'<{next_url}>; rel="next"'
+    return response
 
 
 
@@ -78,7 +106,7 @@ async def get_contact(contact_id: int, db: AsyncSession = Depends(get_db), user:
 
 
 
-@router.get('/search/', response_model=list[ContactResponse])
+@router.get('/search/', response_model=None, responses={200: {'model': list[ContactListItem]}})
 async def search_contacts(query: str, db: AsyncSession = Depends(get_db), user: User = Depends(auth_service.get_current_user)):
 
     """
@@ -91,11 +119,11 @@ async def search_contacts(query: str, db: AsyncSession = Depends(get_db), user:
     :param user: The current authenticated user.
     :type user: User
     :return: A list of contacts matching the search query.
-    :rtype: list[ContactResponse]
+    :rtype: list[ContactListItem]
     """
 
     contacts = await repositories_contacts.search_contacts(query, db, user)
-    return contacts
+    return contact_list_response(contacts)
 
 
 
@@ -122,7 +150,33 @@ async def create_contact(body: ContactCreate, db: AsyncSession = Depends(get_db)
 
 
 
-@router.put('/{contact_id}')
+@router.post('/bulk', response_model=None, responses={201: {'model': list[ContactListItem]}},
+             status_code=status.HTTP_201_CREATED, dependencies=[Depends(RateLimiter(times=5, seconds=60))])
+async def create_contacts(body: list[ContactCreate] = Body(min_length=1, max_length=500), db: AsyncSession = Depends(get_db),
+                          user: User = Depends(auth_service.get_current_user)):
+
+    """
+    Creates up to 500 contacts for the current user in one request.
+
+    :param body: The list of schemas containing the details of the contacts to create.
+    :type body: list[ContactCreate]
+    :param db: The database session.
+    :type db: AsyncSession
+    :param user: The current authenticated user.
+    :type user: User
+    :return: The newly created contacts.
+    :rtype: list[ContactListItem]
+    :raises HTTPException: If the rate limit is exceeded.
+    """
+
+    contacts = await repositories_contacts.create_contacts(body, db, user)
+    response = contact_list_response(contacts)
+    response.status_code = status.HTTP_201_CREATED
+    return response
+
+
+
+@router.put('/{contact_id}', response_model=ContactResponse)
 async def update_contact(body: ContactUpdateSchema, contact_id: int = Path(ge=1), db: AsyncSession = Depends(get_db), user: User = Depends(auth_service.get_current_user)):
 
     """
@@ -165,5 +219,6 @@ async def delete_contact(contact_id: int = Path(ge=1), db: AsyncSession = Depend
     :raises HTTPException: If the contact is not found.
     """
 
-    contact = await repositories_contacts.delete_contact(contact_id, db, user)
-    return contact
\ No newline at end of file
+    deleted = await repositories_contacts.delete_contact(contact_id, db, user)
+    if deleted != 1:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail='NOT FOUND')
\ No newline at end of file
@@ -1,3 +1,5 @@
+import asyncio
+
 from fastapi import APIRouter, Depends, status, UploadFile, File
 from sqlalchemy.ext.asyncio import AsyncSession
 import cloudinary
@@ -7,10 +9,11 @@ from src.database.db import get_db
 from src.database.models import User
 from src.repository import users as repositories_users
 from src.services.auth import auth_service
-from src.conf.config import config
 from src.schemas.user import UserResponse
 
 router = APIRouter(prefix="/users", tags=["users"])
+AVATAR_FOLDER = 'ContactsApp'
+AVATAR_TRANSFORMATION = {'width': 250, 'height': 250, 'crop': 'fill'}
 
 
 @router.patch('/avatar', response_model=UserResponse)
@@ -30,15 +33,8 @@ async def update_avatar_user(file: UploadFile = File(), user: User = Depends(aut
     :rtype: UserResponse
     """
 
-    cloudinary.config(
-        cloud_name=config.CLOUDINARY_NAME,
-        api_key=config.CLOUDINARY_API_KEY,
-        api_secret=config.CLOUDINARY_API_SECRET,
-        secure=True
-    )
-
-    r = cloudinary.uploader.upload(file.file, public_id=f'ContactsApp/{user.username}', overwrite=True)
-    src_url = cloudinary.CloudinaryImage(f'ContactsApp/{user.username}')\
-                        .build_url(width=250, height=250, crop='fill', version=r.get('version'))
+    public_id = f'{AVATAR_FOLDER}/{user.username}'
+    r = await asyncio.to_thread(cloudinary.uploader.upload, file.file, public_id=public_id, overwrite=True)
+    src_url = cloudinary.CloudinaryImage(public_id).build_url(**AVATAR_TRANSFORMATION, version=r.get('version'))
     user = await repositories_users.update_avatar(user.email, src_url, db)
     return user
@@ -1,7 +1,7 @@
 from datetime import date, datetime
 
 from typing import Optional
-from pydantic import BaseModel, Field, EmailStr, ConfigDict
+from pydantic import BaseModel, Field, EmailStr, ConfigDict, TypeAdapter
 
 from src.schemas.user import UserResponse
 
@@ -28,10 +28,21 @@ class ContactCreate(ContactSchema):
     pass
 
 
+class ContactListItem(ContactSchema):
+    id: int
+    created_at: datetime | None
+    updated_at: datetime | None
+
+    model_config = ConfigDict(from_attributes=True) #noqa
+
+
 class ContactResponse(ContactSchema):
     id: int
     created_at: datetime | None
     updated_at: datetime | None
     user: UserResponse | None
 
-    model_config = ConfigDict(from_attributes=True) #noqa
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True) #noqa
+
+
+CONTACT_LIST_ADAPTER = TypeAdapter(list[ContactListItem])
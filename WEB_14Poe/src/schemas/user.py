@@ -1,5 +1,5 @@
 from typing import Optional
-from pydantic import BaseModel, Field, EmailStr, ConfigDict
+from pydantic import BaseModel, Field, EmailStr, ConfigDict, field_validator
 
 
 
@@ -8,6 +8,11 @@ class UserSchema(BaseModel):
     email: EmailStr
     password: str = Field(min_length=6, max_length=8)
 
+    @field_validator('email')
+    @classmethod
+    def normalize_email(cls, v):
+        return v.lower()
+
 
 
 class UserResponse(BaseModel):
@@ -29,4 +34,9 @@ class TokenSchema(BaseModel):
 
 
 class RequestEmail(BaseModel):
-    email: EmailStr
\ No newline at end of file
+    email: EmailStr
+
+    @field_validator('email')
+    @classmethod
+    def normalize_email(cls, v):
+        return v.lower()
\ No newline at end of file
@@ -14,7 +14,8 @@ from src.conf.config import config
 
 
 class Auth:
-    pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+    pwd_context = CryptContext(schemes=["argon2", "bcrypt"], deprecated="auto",
+                               argon2__time_cost=2, argon2__memory_cost=65536, argon2__parallelism=1)
     SECRET_KEY = config.SECRET_KEY_JWT
     ALGORITHM = config.ALGORITHM
 
@@ -81,7 +82,7 @@ class Auth:
         except JWTError as e:
             raise credentials_exception
 
-        user = await repository_users.get_user_by_email(email, db)
+        user = await repository_users.get_cached_user_by_email(email, db)
         if user is None:
             raise credentials_exception
         return user
@@ -1,8 +1,9 @@
 from unittest.mock import Mock
 
 import pytest
-from tests.conftest import TestingSessionLocal
+from tests.conftest import TestingSessionLocal, test_user
 from sqlalchemy import select
+from fastapi import Request, Response
 
 from src.conf import messages
 from src.database.models import User
@@ -80,4 +81,30 @@ def test_validation_error_login(client):
                            data={"password": user_data.get("password")})
     assert response.status_code == 422, response.text
     data = response.json()
-    assert "detail" in data
\ No newline at end of file
+    assert "detail" in data
+
+
+async def skip_rate_limit(self, request: Request, response: Response):
+    return None
+
+
+def test_request_email_unknown_user(client, monkeypatch):
+    mock_send_email = Mock()
+    monkeypatch.setattr("src.routes.auth.send_email", mock_send_email)
+    monkeypatch.setattr("fastapi_limiter.depends.RateLimiter.__call__", skip_rate_limit)
+    response = client.post("api/auth/request_email", json={"email": "nobody@example.com"})
+    assert response.status_code == 200, response.text
+    data = response.json()
+    assert data["message"] == "Check your email for confirmation."
+    assert not mock_send_email.called
+
+
+def test_request_email_confirmed_user(client, monkeypatch):
+    mock_send_email = Mock()
+    monkeypatch.setattr("src.routes.auth.send_email", mock_send_email)
+    monkeypatch.setattr("fastapi_limiter.depends.RateLimiter.__call__", skip_rate_limit)
+    response = client.post("api/auth/request_email", json={"email": test_user["email"]})
+    assert response.status_code == 200, response.text
+    data = response.json()
+    assert data["message"] == "Your email is already confirmed"
+    assert not mock_send_email.called
@@ -1,13 +1,15 @@
 
 import unittest
-from unittest.mock import MagicMock, AsyncMock
+from datetime import date
+from unittest.mock import MagicMock, AsyncMock, patch
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 
 from src.database.models import Contact, User
 from src.schemas.contact import ContactSchema, ContactUpdateSchema
-from src.repository.contacts import get_contacts, search_contacts, get_contact, create_contact, update_contact, delete_contact
+from src.repository.contacts import get_contacts, search_contacts, get_contact, create_contact, create_contacts, update_contact, delete_contact, \
+                                    get_upcoming_birthdays
 
 
 
@@ -29,6 +31,18 @@ class TestAsyncContact(unittest.IsolatedAsyncioTestCase):
         result = await get_contacts(limit, offset, self.session, self.user)
         self.assertEqual(result, contacts)
 
+    async def test_get_contacts_after_id(self):
+        contacts = [Contact(id=3, firstname='firstname3', surname='surname3', email='test3@example.com',
+                            phone='phone3', birthday='2004-04-04', details='details3', user=self.user)]
+        mocked_contacts = MagicMock()
+        mocked_contacts.scalars.return_value.all.return_value = contacts
+        self.session.execute.return_value = mocked_contacts
+        result = await get_contacts(10, 0, self.session, self.user, after_id=2)
+        self.assertEqual(result, contacts)
+        statmnt = self.session.execute.call_args.args[0]
+        self.assertIsNone(statmnt._offset_clause)
+        self.assertIn('contacts.id >', str(statmnt))
+
     async def test_get_contact(self):
         contact_id = 1
         contacts = [Contact(id=contact_id, firstname='firstname1', surname='surname1', email='test1@example.com',
@@ -69,12 +83,27 @@ class TestAsyncContact(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(result.details, body.details)
 
 
+    async def test_create_contacts(self):
+        bodies = [ContactSchema(firstname='test_firstname1', surname='test_surname1', email='test1@example.com',
+                                phone='test_phone1', birthday='2002-02-02', details='test_details1'),
+                  ContactSchema(firstname='test_firstname2', surname='test_surname2', email='test2@example.com',
+                                phone='test_phone2', birthday='2003-03-03')]
+        contacts = [Contact(id=index + 1, **body.model_dump(), user_id=self.user.id) for index, body in enumerate(bodies)]
+        mocked_contacts = MagicMock()
+        mocked_contacts.all.return_value = contacts
+        self.session.scalars.return_value = mocked_contacts
+        result = await create_contacts(bodies, self.session, self.user)
+        self.assertEqual(result, contacts)
+        self.assertEqual(len(self.session.scalars.call_args.args[1]), len(bodies))
+        self.session.commit.assert_awaited_once()
+
+
     async def test_update_contact(self):
         body = ContactUpdateSchema(firstname='test_firstname', surname='test_surname', email='test1@example.com', 
                                    phone='test_phone', birthday='2002-02-02', details='test_details')
         mocked_contact = MagicMock()
         mocked_contact.scalar_one_or_none.return_value = Contact(firstname='test_firstname', surname='test_surname', 
-                                                                 email='test1@example.com', phone='test_phone', birthday='2002-02-02', 
+                                                                 email='test1@example.com', phone='test_phone', birthday=body.birthday, 
                                                                  details='test_details', user=self.user)
         self.session.execute.return_value = mocked_contact
         result = await update_contact(1, body, self.session, self.user)
@@ -88,13 +117,12 @@ class TestAsyncContact(unittest.IsolatedAsyncioTestCase):
 
 
     async def test_delete_contact(self):
-        mocked_contact = MagicMock()
-        mocked_contact.scalar_one_or_none.return_value = Contact(id=1, firstname='test_firstname', surname='test_surname', 
-                                                                 email='test1@example.com', phone='test_phone', birthday='2002-02-02', 
-                                                                 details='test_details', user=self.user)
-        self.session.execute.return_value = mocked_contact
+        mocked_result = MagicMock()
+        mocked_result.rowcount = 1
+        self.session.execute.return_value = mocked_result
         result = await delete_contact(1, self.session, self.user)
-        self.assertIsInstance(result, Contact)
+        self.assertEqual(result, 1)
+        self.session.commit.assert_awaited_once()
 
 
     async def test_search_contacts(self):
@@ -111,6 +139,43 @@ class TestAsyncContact(unittest.IsolatedAsyncioTestCase):
     
         result = await search_contacts(query, self.session, self.user)
         self.assertEqual(result, contacts)
+        statmnt = self.session.execute.call_args.args[0]
+        self.assertEqual(set(statmnt.compile().params.values()) - {self.user.id}, {'%test%'})
+
+
+    async def test_search_contacts_escapes_wildcards(self):
+        mocked_contacts = MagicMock()
+        mocked_contacts.scalars.return_value.all.return_value = []
+        self.session.execute.return_value = mocked_contacts
+        await search_contacts('50%_off\\', self.session, self.user)
+        statmnt = self.session.execute.call_args.args[0]
+        self.assertEqual(set(statmnt.compile().params.values()) - {self.user.id}, {'%50\\%\\_off\\\\%'})
+        self.assertEqual(str(statmnt).count("ESCAPE '\\'"), 3)
+
+
+    async def get_birthdays_statement(self, today):
+        mocked_contacts = MagicMock()
+        mocked_contacts.scalars.return_value.all.return_value = []
+        self.session.execute.return_value = mocked_contacts
+        with patch('src.repository.contacts.datetime') as mocked_datetime:
+            mocked_datetime.now.return_value.date.return_value = today
+            result = await get_upcoming_birthdays(self.session, self.user)
+        self.assertEqual(result, [])
+        statmnt = self.session.execute.call_args.args[0]
+        return str(statmnt), sorted(statmnt.compile().params.values())
+
+
+    async def test_get_upcoming_birthdays(self):
+        sql, params = await self.get_birthdays_statement(date(2024, 6, 10))
+        self.assertIn('BETWEEN', sql)
+        self.assertEqual(params, [self.user.id, 610, 617])
+
+
+    async def test_get_upcoming_birthdays_year_wrap(self):
+        sql, params = await self.get_birthdays_statement(date(2024, 12, 28))
+        self.assertNotIn('BETWEEN', sql)
+        self.assertIn(' OR ', sql)
+        self.assertEqual(params, [self.user.id, 104, 1228])
 
 
 if __name__ == '__main__':
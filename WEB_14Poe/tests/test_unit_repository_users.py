@@ -1,11 +1,13 @@
 import unittest
 from unittest.mock import MagicMock, AsyncMock, patch
 
+import orjson
+from redis.exceptions import RedisError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database.models import Contact, User
 from src.schemas.user import UserSchema, UserResponse, TokenSchema
-from src.repository.users import get_user_by_email, update_token, confirmed_email, update_avatar
+from src.repository.users import get_user_by_email, get_cached_user_by_email, update_token, confirmed_email, update_avatar
 
 
 
@@ -32,8 +34,86 @@ class TestAsyncContact(unittest.IsolatedAsyncioTestCase):
 
 
     async def test_confirmed_email(self):
-        self.user.confirmed = False
+        await confirmed_email(self.user.email, self.session)
+        statmnt = self.session.execute.call_args.args[0]
+        self.assertEqual(statmnt.compile().params, {'confirmed': True, 'lower_1': self.user.email})
+        self.session.commit.assert_awaited_once()
 
-        with patch('src.repository.users.get_user_by_email', return_value=self.user):
-            await confirmed_email(self.user.email, self.session)
-            self.assertTrue(self.user.confirmed)
\ No newline at end of file
+    async def test_get_cached_user_by_email_hit(self):
+        cache = AsyncMock()
+        cache.get.return_value = orjson.dumps({'id': 1, 'username': 'test_user', 'email': 'test_email',
+                                               'avatar': None, 'confirmed': True})
+        self.session.merge.side_effect = lambda user, load: user
+        with patch('src.repository.users.FastAPILimiter.redis', cache):
+            result = await get_cached_user_by_email(self.user.email, self.session)
+        self.assertEqual(result.id, self.user.id)
+        self.assertEqual(result.email, self.user.email)
+        self.assertNotIn('password', result.__dict__)
+        cache.get.assert_awaited_once_with(f'user:{self.user.email}')
+        self.session.merge.assert_awaited_once_with(result, load=False)
+        self.session.execute.assert_not_called()
+
+
+    async def test_get_cached_user_by_email_miss(self):
+        cache = AsyncMock()
+        cache.get.return_value = None
+        mocked_user = MagicMock()
+        mocked_user.scalar_one_or_none.return_value = self.user
+        self.session.execute.return_value = mocked_user
+        with patch('src.repository.users.FastAPILimiter.redis', cache):
+            result = await get_cached_user_by_email(self.user.email, self.session)
+        self.assertEqual(result, self.user)
+        key, value = cache.set.call_args.args
+        self.assertEqual(key, f'user:{self.user.email}')
+        self.assertEqual(orjson.loads(value), {'id': 1, 'username': 'test_user', 'email': 'test_email',
+                                               'avatar': None, 'confirmed': True})
+
+
+    async def test_get_cached_user_by_email_redis_error(self):
+        cache = AsyncMock()
+        cache.get.side_effect = RedisError('connection refused')
+        mocked_user = MagicMock()
+        mocked_user.scalar_one_or_none.return_value = self.user
+        self.session.execute.return_value = mocked_user
+        with patch('src.repository.users.FastAPILimiter.redis', cache):
+            result = await get_cached_user_by_email(self.user.email, self.session)
+        self.assertEqual(result, self.user)
+        cache.set.assert_not_awaited()
+
+
+    async def test_get_cached_user_by_email_redis_set_error(self):
+        cache = AsyncMock()
+        cache.get.return_value = None
+        cache.set.side_effect = RedisError('connection refused')
+        mocked_user = MagicMock()
+        mocked_user.scalar_one_or_none.return_value = self.user
+        self.session.execute.return_value = mocked_user
+        with patch('src.repository.users.FastAPILimiter.redis', cache):
+            result = await get_cached_user_by_email(self.user.email, self.session)
+        self.assertEqual(result, self.user)
+
+
+    async def test_update_token_invalidates_cache(self):
+        cache = AsyncMock()
+        with patch('src.repository.users.FastAPILimiter.redis', cache):
+            await update_token(self.user, 'new_token', self.session)
+        cache.delete.assert_awaited_once_with(f'user:{self.user.email}')
+
+
+    async def test_update_avatar_invalidates_cache(self):
+        cache = AsyncMock()
+        mocked_user = MagicMock()
+        mocked_user.scalar_one_or_none.return_value = self.user
+        self.session.execute.return_value = mocked_user
+        with patch('src.repository.users.FastAPILimiter.redis', cache):
+            result = await update_avatar(self.user.email, 'avatar_url', self.session)
+        self.assertEqual(result.avatar, 'avatar_url')
+        cache.delete.assert_awaited_once_with(f'user:{self.user.email}')
+
+
+    async def test_invalidate_cache_redis_error(self):
+        cache = AsyncMock()
+        cache.delete.side_effect = RedisError('connection refused')
+        with patch('src.repository.users.FastAPILimiter.redis', cache):
+            await update_token(self.user, 'new_token', self.session)
+        self.assertEqual(self.user.refresh_token, 'new_token')